@@ -49,12 +49,10 @@ class BaseAgent(ABC):
         # Parse thinking output
         try:
             # Look for JSON in the response
-            start_idx = response.find('{')
-            end_idx = response.rfind('}') + 1
-            if start_idx != -1 and end_idx != 0:
-                json_str = response[start_idx:end_idx]
-                return json.loads(json_str)
-        except:
+            thinking = self._extract_json(response)
+            if thinking is not None:
+                return thinking
+        except Exception:
             pass
             
         # Fallback if parsing fails
@@ -65,11 +63,36 @@ class BaseAgent(ABC):
             "challenges": ["Unknown"]
         }
     
-    async def _call_llm(self, prompt: str, max_tokens: int = 4000) -> str:
-        """Make a call to the LLM using the appropriate provider"""
+    def _extract_json(self, response: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract the outermost JSON object from an LLM response
+        
+        Returns None if the response contains no object; raises ValueError
+        if the object found is not valid JSON.
+        """
+        start_idx = response.find('{')
+        end_idx = response.rfind('}') + 1
+        if start_idx == -1 or end_idx == 0:
+            return None
+        return json.loads(response[start_idx:end_idx])
+    
+    async def _call_llm(
+        self,
+        prompt: str,
+        max_tokens: int = 4000,
+        record_history: bool = True
+    ) -> str:
+        """
+        Make a call to the LLM using the appropriate provider
+        
+        Calls running concurrently on one agent should pass
+        record_history=False so they don't interleave turns into the
+        shared conversation history.
+        """
         try:
             # Prepare messages
-            messages = self.conversation_history + [{"role": "user", "content": prompt}]
+            user_message = {"role": "user", "content": prompt}
+            messages = self.conversation_history + [user_message]
             
             # Call the model using the provider manager
             response, token_count = await model_manager.call_model(
@@ -82,9 +105,12 @@ class BaseAgent(ABC):
             
             self.total_tokens += token_count
             
-            # Update conversation history
-            self.conversation_history.append({"role": "user", "content": prompt})
-            self.conversation_history.append({"role": "assistant", "content": response})
+            # Update conversation history with the whole turn at once
+            if record_history:
+                self.conversation_history.extend((
+                    user_message,
+                    {"role": "assistant", "content": response}
+                ))
             
             return response
             
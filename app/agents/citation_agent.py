@@ -1,6 +1,7 @@
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Set
 import re
-import json
+import asyncio
+from collections import Counter
 from dataclasses import dataclass
 
 from app.agents.base_agent import BaseAgent
@@ -12,6 +13,12 @@ from app.core.config import settings
 @dataclass
 class Citation:
     """Represents a citation to be inserted"""
+    # Declared by hand (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = (
+        "claim_text", "source_index", "source_url",
+        "source_title", "confidence", "position"
+    )
+    
     claim_text: str
     source_index: int
     source_url: str
@@ -81,70 +88,93 @@ class CitationAgent(BaseAgent):
         # Split report into sentences for analysis
         sentences = self._split_into_sentences(report)
         
-        # Batch sentences for efficient processing
+        # Batch sentences for efficient processing; batches are independent,
+        # so they run concurrently up to MAX_PARALLEL_CITATION_CALLS and
+        # stay out of the conversation history
         batch_size = 10
-        all_claims = []
+        semaphore = asyncio.Semaphore(settings.MAX_PARALLEL_CITATION_CALLS)
         
-        for i in range(0, len(sentences), batch_size):
-            batch = sentences[i:i + batch_size]
-            batch_text = "\n".join([f"{j+1}. {sent}" for j, sent in enumerate(batch)])
-            
-            prompt = f"""
-            Identify factual claims in these sentences that require citations.
-            
-            Sentences:
-            {batch_text}
-            
-            For each sentence containing a factual claim, identify:
-            1. The sentence number
-            2. The specific claim that needs citation
-            3. The type of claim (statistic, fact, quote, finding, comparison)
-            4. How important citation is (high/medium/low)
-            
-            Skip:
-            - General knowledge or common facts
-            - Transitional sentences
-            - Questions or hypotheticals
-            - Section headers
-            
-            Output as JSON:
-            {{
-                "claims": [
-                    {{
-                        "sentence_num": 1,
-                        "text": "...",
-                        "claim": "specific claim text",
-                        "type": "statistic|fact|quote|finding|comparison",
-                        "importance": "high|medium|low"
-                    }}
-                ]
-            }}
-            """
-            
-            response = await self._call_llm(prompt, max_tokens=2000)
-            
-            try:
-                # Extract JSON from response
-                start_idx = response.find('{')
-                end_idx = response.rfind('}') + 1
-                if start_idx != -1 and end_idx != 0:
-                    json_str = response[start_idx:end_idx]
-                    data = json.loads(json_str)
-                    
-                    # Adjust sentence numbers to global position
-                    for claim in data.get("claims", []):
-                        claim["sentence_num"] = i + claim["sentence_num"] - 1
-                        if claim["sentence_num"] < len(sentences):
-                            claim["text"] = sentences[claim["sentence_num"]]
-                        
-                    all_claims.extend(data.get("claims", []))
+        async def identify_batch(start: int) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._identify_claims_in_batch(sentences, start, batch_size)
                 
-            except Exception as e:
-                print(f"Error parsing claims: {e}")
+        batch_claims = await asyncio.gather(
+            *(identify_batch(i) for i in range(0, len(sentences), batch_size)),
+            return_exceptions=True
+        )
+        
+        all_claims = []
+        for claims in batch_claims:
+            if isinstance(claims, Exception):
+                # A failed batch just contributes no claims
+                print(f"Error identifying claims: {claims}")
                 continue
+            all_claims.extend(claims)
                 
         return all_claims
         
+    async def _identify_claims_in_batch(
+        self,
+        sentences: List[str],
+        start: int,
+        batch_size: int
+    ) -> List[Dict[str, Any]]:
+        """Identify claims in one batch of sentences starting at index start"""
+        
+        batch = sentences[start:start + batch_size]
+        batch_text = "\n".join([f"{j+1}. {sent}" for j, sent in enumerate(batch)])
+        
+        prompt = f"""
+        Identify factual claims in these sentences that require citations.
+        
+        Sentences:
+        {batch_text}
+        
+        For each sentence containing a factual claim, identify:
+        1. The sentence number
+        2. The specific claim that needs citation
+        3. The type of claim (statistic, fact, quote, finding, comparison)
+        4. How important citation is (high/medium/low)
+        
+        Skip:
+        - General knowledge or common facts
+        - Transitional sentences
+        - Questions or hypotheticals
+        - Section headers
+        
+        Output as JSON:
+        {{
+            "claims": [
+                {{
+                    "sentence_num": 1,
+                    "text": "...",
+                    "claim": "specific claim text",
+                    "type": "statistic|fact|quote|finding|comparison",
+                    "importance": "high|medium|low"
+                }}
+            ]
+        }}
+        """
+        
+        response = await self._call_llm(prompt, max_tokens=2000, record_history=False)
+        
+        try:
+            # Extract JSON from response
+            data = self._extract_json(response)
+            if data is not None:
+                # Adjust sentence numbers to global position
+                for claim in data.get("claims", []):
+                    claim["sentence_num"] = start + claim["sentence_num"] - 1
+                    if claim["sentence_num"] < len(sentences):
+                        claim["text"] = sentences[claim["sentence_num"]]
+                    
+                return data.get("claims", [])
+            
+        except Exception as e:
+            print(f"Error parsing claims: {e}")
+            
+        return []
+        
     async def _match_claims_to_sources(
         self,
         claims: List[Dict[str, Any]],
@@ -155,29 +185,36 @@ class CitationAgent(BaseAgent):
         
         citations = []
         
-        # If we have findings with explicit source mappings, use those first
+        # If we have findings with explicit source mappings, use those first.
+        # Fact word sets are built once here rather than per claim comparison.
         finding_map = {}
         if findings:
             for finding in findings:
                 fact = finding.get("fact", "")
                 source_url = finding.get("source_url", "")
                 if fact and source_url:
-                    finding_map[fact.lower()] = source_url
+                    fact_text = fact.lower()
+                    finding_map[fact_text] = (set(fact_text.split()), source_url)
+                    
+        # Index sources by URL (first occurrence wins)
+        source_positions = {}
+        for i, source in enumerate(sources):
+            source_positions.setdefault(source.url, i + 1)
                     
         # Process claims
         for claim in claims:
             # First check if this claim matches a known finding
             claim_text = claim["claim"].lower()
+            claim_words = set(claim_text.split())
             matched_source = None
             
             # Check finding map
-            for fact_text, source_url in finding_map.items():
-                if self._text_similarity(claim_text, fact_text) > 0.7:
+            for fact_text, (fact_words, source_url) in finding_map.items():
+                if self._text_similarity(claim_text, fact_text, claim_words, fact_words) > 0.7:
                     # Find the source index
-                    for i, source in enumerate(sources):
-                        if source.url == source_url:
-                            matched_source = (i + 1, source, 0.9)
-                            break
+                    source_idx = source_positions.get(source_url)
+                    if source_idx is not None:
+                        matched_source = (source_idx, sources[source_idx - 1], 0.9)
                     break
                     
             # If no direct match, search all sources
@@ -254,11 +291,8 @@ class CitationAgent(BaseAgent):
         
         try:
             # Extract JSON from response
-            start_idx = response.find('{')
-            end_idx = response.rfind('}') + 1
-            if start_idx != -1 and end_idx != 0:
-                json_str = response[start_idx:end_idx]
-                data = json.loads(json_str)
+            data = self._extract_json(response)
+            if data is not None:
                 matches = []
                 
                 for match in data.get("matches", []):
@@ -330,18 +364,18 @@ class CitationAgent(BaseAgent):
     ) -> List[Dict[str, Any]]:
         """Generate a formatted citation list"""
         
-        # Get unique sources that were cited
-        cited_indices = sorted(set(c.source_index for c in citations))
+        # Count citations per source in a single pass
+        cite_counts = Counter(c.source_index for c in citations)
         
         citation_list = []
-        for idx in cited_indices:
+        for idx in sorted(cite_counts):
             source = source_index.get(idx)
             if source:
                 citation_list.append({
                     "index": idx,
                     "title": source.title,
                     "url": source.url,
-                    "times_cited": sum(1 for c in citations if c.source_index == idx)
+                    "times_cited": cite_counts[idx]
                 })
                 
         return citation_list
@@ -360,8 +394,18 @@ class CitationAgent(BaseAgent):
                 
         return cleaned
         
-    def _text_similarity(self, text1: str, text2: str) -> float:
-        """Calculate simple text similarity (0-1)"""
+    def _text_similarity(
+        self,
+        text1: str,
+        text2: str,
+        words1: Optional[Set[str]] = None,
+        words2: Optional[Set[str]] = None
+    ) -> float:
+        """
+        Calculate simple text similarity (0-1)
+        
+        Callers comparing one text against many can pass precomputed word sets.
+        """
         # Simple implementation - in production use better similarity metrics
         text1_lower = text1.lower()
         text2_lower = text2.lower()
@@ -374,8 +418,10 @@ class CitationAgent(BaseAgent):
             return 0.8
             
         # Count common words
-        words1 = set(text1_lower.split())
-        words2 = set(text2_lower.split())
+        if words1 is None:
+            words1 = set(text1_lower.split())
+        if words2 is None:
+            words2 = set(text2_lower.split())
         
         if not words1 or not words2:
             return 0.0
@@ -395,14 +441,14 @@ class CitationAgent(BaseAgent):
         
         bibliography = "\n\n## References\n\n"
         
+        # Index sources by URL once; the first occurrence of a URL wins
+        sources_by_url: Dict[str, SearchResult] = {}
+        for s in sources:
+            sources_by_url.setdefault(s.url, s)
+        
         for citation in citation_list:
             idx = citation["index"]
-            # Find the source by matching the citation info
-            source = None
-            for s in sources:
-                if s.url == citation["url"]:
-                    source = s
-                    break
+            source = sources_by_url.get(citation["url"])
             
             if source:
                 if style == "MLA":
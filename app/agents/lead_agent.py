@@ -19,12 +19,13 @@ from app.tools.memory_tools import MemoryStore
 class LeadResearchAgent(BaseAgent):
     """Lead agent that orchestrates the research process"""
     
-    def __init__(self):
+    def __init__(self, memory_store: Optional[MemoryStore] = None):
         super().__init__(
             model=settings.LEAD_AGENT_MODEL,
             name="Lead Research Agent"
         )
-        self.memory_store = MemoryStore()
+        # Share the caller's store so saved results outlive this agent
+        self.memory_store = memory_store if memory_store is not None else MemoryStore()
         self.active_subagents: Dict[str, SearchSubAgent] = {}
         self.citation_list = []
         
@@ -33,21 +34,21 @@ class LeadResearchAgent(BaseAgent):
         
     async def conduct_research(self, query: ResearchQuery) -> ResearchResult:
         """Main entry point for conducting research"""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         research_id = uuid4()
         
         # Save initial context
         await self.memory_store.save_context(
             research_id, 
-            {"query": query.dict(), "status": "planning"}
+            {"query": query.model_dump(), "status": "planning"}
         )
         
         # Phase 1: Analyze query and create research plan
         plan = await self._create_research_plan(query)
         await self.memory_store.save_context(
             research_id,
-            {"plan": plan.dict(), "status": "executing"}
+            {"plan": plan.model_dump(), "status": "executing"}
         )
         
         # Phase 2: Execute research plan with subagents
@@ -62,9 +63,10 @@ class LeadResearchAgent(BaseAgent):
         # Extract sections from report
         sections = self._extract_report_sections(cited_report)
 
-        # Convert citation_list to CitationInfo objects
+        # Convert citation_list to CitationInfo objects; the citation agent
+        # builds these dicts from validated sources, so skip re-validation
         citation_infos = [
-            CitationInfo(**citation)
+            CitationInfo.model_construct(**citation)
             for citation in self.citation_list
         ]
         
@@ -80,7 +82,7 @@ class LeadResearchAgent(BaseAgent):
             citations=citation_infos,
             sources_used=all_sources,
             total_tokens_used=self.total_tokens + sum(r.token_count for r in results),
-            execution_time=time.time() - start_time,
+            execution_time=time.perf_counter() - start_time,
             subagent_count=len(results),
             report_sections=sections
         )
@@ -131,12 +133,8 @@ class LeadResearchAgent(BaseAgent):
         # Parse response
         try:
             # Extract JSON from response
-            start_idx = response.find('{')
-            end_idx = response.rfind('}') + 1
-            if start_idx != -1 and end_idx != 0:
-                json_str = response[start_idx:end_idx]
-                plan_data = json.loads(json_str)
-                
+            plan_data = self._extract_json(response)
+            if plan_data is not None:
                 subtasks = [
                     SubAgentTask(
                         objective=task["objective"],
@@ -179,6 +177,10 @@ class LeadResearchAgent(BaseAgent):
         remaining_tasks = plan.subtasks.copy()
         iteration = 0
         
+        # Running totals so the follow-up check doesn't rescan every result
+        total_sources = 0
+        relevance_sum = 0.0
+        
         while remaining_tasks and iteration < max_iterations:
             iteration += 1
             
@@ -191,7 +193,7 @@ class LeadResearchAgent(BaseAgent):
             batch_tasks = []
             for task in current_batch:
                 subagent = SearchSubAgent(task.task_id)
-                self.active_subagents[str(task.task_id)] = subagent
+                self.active_subagents[task.task_id] = subagent
                 batch_tasks.append(subagent.execute_task(task))
                 
             # Execute batch in parallel
@@ -204,9 +206,16 @@ class LeadResearchAgent(BaseAgent):
                     # Could retry or handle error
                 else:
                     results.append(result)
+                    if result.sources:
+                        total_sources += len(result.sources)
+                        relevance_sum += (
+                            sum(s.relevance_score for s in result.sources) / len(result.sources)
+                        )
                     
             # Check if we need more research based on results
-            if await self._needs_more_research(results, plan.strategy):
+            if await self._needs_more_research(
+                len(results), total_sources, relevance_sum, plan.strategy
+            ):
                 # Create additional tasks if needed
                 new_tasks = await self._create_followup_tasks(results)
                 remaining_tasks.extend(new_tasks)
@@ -215,23 +224,26 @@ class LeadResearchAgent(BaseAgent):
         
     async def _needs_more_research(
         self, 
-        current_results: List[SubAgentResult], 
+        result_count: int, 
+        total_sources: int, 
+        relevance_sum: float, 
         strategy: str
     ) -> bool:
-        """Determine if more research is needed"""
+        """
+        Determine if more research is needed
+        
+        relevance_sum is the sum over results of each result's mean source
+        relevance, accumulated by the caller as results arrive.
+        """
         
         # Simple heuristic - in production would be more sophisticated
-        if not current_results:
+        if not result_count:
             return True
             
-        total_sources = sum(len(r.sources) for r in current_results)
         if total_sources == 0:
             return True
             
-        avg_relevance = sum(
-            sum(s.relevance_score for s in r.sources) / len(r.sources) 
-            for r in current_results if r.sources
-        ) / len(current_results)
+        avg_relevance = relevance_sum / result_count
         
         # Need more research if we have few sources or low relevance
         return total_sources < 5 or avg_relevance < 0.7
@@ -269,11 +281,8 @@ class LeadResearchAgent(BaseAgent):
         
         try:
             # Extract JSON from response
-            start_idx = response.find('{')
-            end_idx = response.rfind('}') + 1
-            if start_idx != -1 and end_idx != 0:
-                json_str = response[start_idx:end_idx]
-                data = json.loads(json_str)
+            data = self._extract_json(response)
+            if data is not None:
                 return [
                     SubAgentTask(
                         objective=task["objective"],
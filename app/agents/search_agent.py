@@ -1,7 +1,5 @@
 from typing import List, Dict, Any, Optional
 import asyncio
-from uuid import UUID
-import json
 
 from app.agents.base_agent import BaseAgent
 from app.models.schemas import SubAgentTask, SubAgentResult, SearchResult
@@ -12,7 +10,7 @@ from app.tools.search_tools import WebSearchTool
 class SearchSubAgent(BaseAgent):
     """Subagent specialized in searching for specific information"""
     
-    def __init__(self, task_id: UUID):
+    def __init__(self, task_id: str):
         super().__init__(
             model=settings.SUBAGENT_MODEL,
             name=f"Search Subagent {task_id}"
@@ -151,12 +149,8 @@ class SearchSubAgent(BaseAgent):
         # Parse evaluations and update relevance scores
         try:
             # Extract JSON from response
-            start_idx = response.find('{')
-            end_idx = response.rfind('}') + 1
-            if start_idx != -1 and end_idx != 0:
-                json_str = response[start_idx:end_idx]
-                data = json.loads(json_str)
-                
+            data = self._extract_json(response)
+            if data is not None:
                 for eval in data.get("evaluations", []):
                     idx = eval["index"] - 1
                     if 0 <= idx < len(results):
@@ -216,11 +210,8 @@ class SearchSubAgent(BaseAgent):
         
         try:
             # Extract JSON from response
-            start_idx = response.find('{')
-            end_idx = response.rfind('}') + 1
-            if start_idx != -1 and end_idx != 0:
-                json_str = response[start_idx:end_idx]
-                data = json.loads(json_str)
+            data = self._extract_json(response)
+            if data is not None:
                 return data.get("findings", [])
         except Exception as e:
             print(f"Error parsing findings: {e}")
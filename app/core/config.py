@@ -27,6 +27,9 @@ class Settings:
         "claude-3-haiku": "claude-3-haiku-20240307"
     }
     
+    # Model ids above as a set, for O(1) membership checks on every LLM call
+    ANTHROPIC_MODEL_IDS = frozenset(AVAILABLE_MODELS.values())
+    
     # Available Ollama Models (Popular local models)
     OLLAMA_MODELS = {
         # Large Language Models
@@ -93,22 +96,69 @@ class Settings:
     SUBAGENT_MODEL: str = os.getenv("SUBAGENT_MODEL", AVAILABLE_MODELS["claude-4-sonnet"])
     CITATION_MODEL: str = os.getenv("CITATION_MODEL", AVAILABLE_MODELS["claude-3-5-haiku"])
     
+    # Recommended model combinations, built once and served by get_model_info
+    RECOMMENDED_CONFIGS = {
+        "anthropic_high_performance": {
+            "lead_agent": AVAILABLE_MODELS["claude-4-opus"],
+            "subagent": AVAILABLE_MODELS["claude-4-sonnet"],
+            "citation": AVAILABLE_MODELS["claude-3-5-haiku"]
+        },
+        "anthropic_balanced": {
+            "lead_agent": AVAILABLE_MODELS["claude-4-sonnet"],
+            "subagent": AVAILABLE_MODELS["claude-4-sonnet"],
+            "citation": AVAILABLE_MODELS["claude-3-5-haiku"]
+        },
+        "anthropic_cost_optimized": {
+            "lead_agent": AVAILABLE_MODELS["claude-3-5-sonnet-latest"],
+            "subagent": AVAILABLE_MODELS["claude-3-5-sonnet-latest"],
+            "citation": AVAILABLE_MODELS["claude-3-5-haiku"]
+        },
+        "ollama_high_performance": {
+            "lead_agent": "llama3.1:70b",
+            "subagent": "llama3.1:8b",
+            "citation": "llama3.2:3b"
+        },
+        "ollama_balanced": {
+            "lead_agent": "llama3.1:8b",
+            "subagent": "mistral:7b",
+            "citation": "llama3.2:3b"
+        },
+        "ollama_lightweight": {
+            "lead_agent": "mistral:7b",
+            "subagent": "llama3.2:3b",
+            "citation": "phi3:3.8b"
+        },
+        "mixed_optimal": {
+            "lead_agent": AVAILABLE_MODELS["claude-4-sonnet"],
+            "subagent": "llama3.1:8b",
+            "citation": "llama3.2:3b"
+        }
+    }
+    
     # Agent Configuration
     MAX_THINKING_LENGTH: int = 50000
     MAX_CONTEXT_LENGTH: int = 200000
     MAX_PARALLEL_SUBAGENTS: int = 5
+    MAX_PARALLEL_CITATION_CALLS: int = 5
     
     # Tool Configuration
     SEARCH_TIMEOUT: int = 30
     MAX_SEARCH_RESULTS: int = 10
+    SEARCH_CACHE_TTL: int = 900  # 15 minutes
+    SEARCH_CACHE_MAX_SIZE: int = 1000
     
     # Memory Configuration
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379")
     MEMORY_TTL: int = 3600  # 1 hour
+    MEMORY_CLEANUP_INTERVAL: int = 300  # 5 minutes
     
     # Rate Limiting
     MAX_TOKENS_PER_REQUEST: int = 100000
     
+    # Provider Status
+    PROVIDER_STATUS_REFRESH_INTERVAL: int = 60  # seconds
+    PROVIDER_CHECK_TIMEOUT: int = 5  # seconds
+    
     @classmethod
     def get_model_info(cls) -> dict:
         """Get information about available models from all providers"""
@@ -116,53 +166,17 @@ class Settings:
             "anthropic_models": cls.AVAILABLE_MODELS,
             "ollama_models": cls.OLLAMA_MODELS,
             "current_config": {
-                "lead_agent": cls().LEAD_AGENT_MODEL,
-                "subagent": cls().SUBAGENT_MODEL, 
-                "citation": cls().CITATION_MODEL
+                "lead_agent": cls.LEAD_AGENT_MODEL,
+                "subagent": cls.SUBAGENT_MODEL, 
+                "citation": cls.CITATION_MODEL
             },
-            "recommended_configs": {
-                "anthropic_high_performance": {
-                    "lead_agent": cls.AVAILABLE_MODELS["claude-4-opus"],
-                    "subagent": cls.AVAILABLE_MODELS["claude-4-sonnet"],
-                    "citation": cls.AVAILABLE_MODELS["claude-3-5-haiku"]
-                },
-                "anthropic_balanced": {
-                    "lead_agent": cls.AVAILABLE_MODELS["claude-4-sonnet"],
-                    "subagent": cls.AVAILABLE_MODELS["claude-4-sonnet"],
-                    "citation": cls.AVAILABLE_MODELS["claude-3-5-haiku"]
-                },
-                "anthropic_cost_optimized": {
-                    "lead_agent": cls.AVAILABLE_MODELS["claude-3-5-sonnet-latest"],
-                    "subagent": cls.AVAILABLE_MODELS["claude-3-5-sonnet-latest"],
-                    "citation": cls.AVAILABLE_MODELS["claude-3-5-haiku"]
-                },
-                "ollama_high_performance": {
-                    "lead_agent": "llama3.1:70b",
-                    "subagent": "llama3.1:8b",
-                    "citation": "llama3.2:3b"
-                },
-                "ollama_balanced": {
-                    "lead_agent": "llama3.1:8b",
-                    "subagent": "mistral:7b",
-                    "citation": "llama3.2:3b"
-                },
-                "ollama_lightweight": {
-                    "lead_agent": "mistral:7b",
-                    "subagent": "llama3.2:3b",
-                    "citation": "phi3:3.8b"
-                },
-                "mixed_optimal": {
-                    "lead_agent": cls.AVAILABLE_MODELS["claude-4-sonnet"],
-                    "subagent": "llama3.1:8b",
-                    "citation": "llama3.2:3b"
-                }
-            }
+            "recommended_configs": cls.RECOMMENDED_CONFIGS
         }
     
     @classmethod
     def validate_model(cls, model_name: str) -> bool:
         """Validate if a model name is supported by any provider"""
-        return (model_name in cls.AVAILABLE_MODELS.values() or 
+        return (model_name in cls.ANTHROPIC_MODEL_IDS or 
                 model_name in cls.OLLAMA_MODELS.keys())
     
     @classmethod
@@ -173,7 +187,7 @@ class Settings:
     @classmethod
     def get_provider_for_model(cls, model_name: str) -> str:
         """Get the provider for a given model"""
-        if model_name in cls.AVAILABLE_MODELS.values():
+        if model_name in cls.ANTHROPIC_MODEL_IDS:
             return "anthropic"
         elif model_name in cls.OLLAMA_MODELS.keys():
             return "ollama"
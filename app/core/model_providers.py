@@ -5,6 +5,7 @@ Model provider abstraction layer for supporting multiple LLM providers
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Tuple
 import asyncio
+import time
 import anthropic
 import ollama
 from dataclasses import dataclass
@@ -115,7 +116,7 @@ class AnthropicProvider(BaseModelProvider):
         
     def validate_model(self, model: str) -> bool:
         """Validate Anthropic model"""
-        return model in settings.AVAILABLE_MODELS.values()
+        return model in settings.ANTHROPIC_MODEL_IDS
         
     async def check_connection(self) -> bool:
         """Check Anthropic API connection"""
@@ -130,7 +131,7 @@ class AnthropicProvider(BaseModelProvider):
                 messages=[{"role": "user", "content": "Hi"}]
             )
             return True
-        except:
+        except Exception:
             return False
 
 
@@ -217,7 +218,7 @@ class OllamaProvider(BaseModelProvider):
         try:
             await self.client.list()
             return True
-        except:
+        except Exception:
             return False
 
 
@@ -229,12 +230,16 @@ class ModelProviderManager:
             ModelProvider.ANTHROPIC: AnthropicProvider(),
             ModelProvider.OLLAMA: OllamaProvider()
         }
+        self._provider_status: Optional[Dict[str, bool]] = None
+        self._provider_status_checked_at = 0.0
+        # In-flight refresh shared by every caller that finds the snapshot stale
+        self._provider_status_refresh: Optional[asyncio.Task] = None
         
     def get_provider_for_model(self, model: str) -> BaseModelProvider:
         """Get the appropriate provider for a model"""
         
         # Check Anthropic models first
-        if model in settings.AVAILABLE_MODELS.values():
+        if model in settings.ANTHROPIC_MODEL_IDS:
             return self.providers[ModelProvider.ANTHROPIC]
             
         # Check Ollama models
@@ -262,35 +267,77 @@ class ModelProviderManager:
     async def get_all_available_models(self) -> Dict[str, List[str]]:
         """Get all available models from all providers"""
         
+        # Query all providers concurrently
+        provider_types = list(self.providers.keys())
+        results = await asyncio.gather(
+            *(self.providers[provider_type].list_available_models() for provider_type in provider_types),
+            return_exceptions=True
+        )
+        
         models = {}
         
-        for provider_type, provider in self.providers.items():
-            try:
-                provider_models = await provider.list_available_models()
-                models[provider_type.value] = provider_models
-            except:
-                models[provider_type.value] = []
+        for provider_type, result in zip(provider_types, results):
+            models[provider_type.value] = [] if isinstance(result, Exception) else result
                 
         return models
         
     async def check_provider_status(self) -> Dict[str, bool]:
         """Check the status of all providers"""
         
+        # Check all providers concurrently; a provider that does not answer
+        # within PROVIDER_CHECK_TIMEOUT is reported as unavailable
+        provider_types = list(self.providers.keys())
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(
+                    self.providers[provider_type].check_connection(),
+                    timeout=settings.PROVIDER_CHECK_TIMEOUT
+                )
+                for provider_type in provider_types
+            ),
+            return_exceptions=True
+        )
+        
         status = {}
         
-        for provider_type, provider in self.providers.items():
-            try:
-                status[provider_type.value] = await provider.check_connection()
-            except:
-                status[provider_type.value] = False
+        for provider_type, result in zip(provider_types, results):
+            status[provider_type.value] = False if isinstance(result, Exception) else result
                 
         return status
         
+    async def refresh_provider_status(self) -> Dict[str, bool]:
+        """Re-check all providers and keep the result as the current snapshot"""
+        
+        self._provider_status = await self.check_provider_status()
+        self._provider_status_checked_at = time.monotonic()
+        return self._provider_status
+        
+    async def get_provider_status(self) -> Dict[str, bool]:
+        """
+        Get the provider status snapshot
+        
+        Providers are only re-checked when the snapshot is missing or older
+        than PROVIDER_STATUS_REFRESH_INTERVAL. The Anthropic check is a real
+        API call, so checks are driven by requests rather than a timer, and
+        concurrent callers share a single in-flight refresh.
+        """
+        
+        age = time.monotonic() - self._provider_status_checked_at
+        if self._provider_status is not None and age <= settings.PROVIDER_STATUS_REFRESH_INTERVAL:
+            return self._provider_status
+            
+        if self._provider_status_refresh is None or self._provider_status_refresh.done():
+            self._provider_status_refresh = asyncio.ensure_future(
+                self.refresh_provider_status()
+            )
+        # Shielded so one cancelled request doesn't cancel the others' check
+        return await asyncio.shield(self._provider_status_refresh)
+        
     def get_model_info(self, model: str) -> ModelInfo:
         """Get information about a specific model"""
         
         # Anthropic models
-        if model in settings.AVAILABLE_MODELS.values():
+        if model in settings.ANTHROPIC_MODEL_IDS:
             return ModelInfo(
                 name=model,
                 provider=ModelProvider.ANTHROPIC,
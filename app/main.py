@@ -1,15 +1,21 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Header
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Dict, Any
+from typing import Dict, Any, Set, Optional
 from uuid import UUID
 import asyncio
+from contextlib import suppress
 
 from app.agents.lead_agent import LeadResearchAgent
 from app.agents.citation_agent import CitationAgent
-from app.models.schemas import ResearchQuery, ResearchResult, SearchResult
+from app.models.schemas import (
+    ResearchQuery, ResearchResult, SearchResult,
+    HealthResponse, ResearchStartResponse
+)
 from app.services.research_service import ResearchService
 from app.core.config import settings
+from app.core.model_providers import model_manager, ModelProvider
+from app.tools.search_tools import close_http_client
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -30,20 +36,57 @@ app.add_middleware(
 # Initialize research service
 research_service = ResearchService()
 
+# Strong references to fire-and-forget research tasks so they are not
+# garbage collected before they finish
+background_research_tasks: Set[asyncio.Task] = set()
+
+# Static response payloads, built once at import
+AVAILABLE_TOOLS = {
+    "tools": [
+        {
+            "name": "web_search",
+            "description": "Search the web for information",
+            "parameters": ["query", "max_results"]
+        },
+        {
+            "name": "memory_store",
+            "description": "Store and retrieve context",
+            "parameters": ["key", "value"]
+        }
+    ]
+}
+
+MODEL_NOTES = {
+    "anthropic": {
+        "claude_4_series": "Latest models with enhanced reasoning and performance",
+        "claude_3_5_series": "Improved versions of Claude 3 with better capabilities", 
+        "claude_3_series": "Original Claude 3 models (legacy support)",
+        "requires": "ANTHROPIC_API_KEY environment variable"
+    },
+    "ollama": {
+        "local_models": "Run models locally without API costs",
+        "privacy": "Complete data privacy - no external API calls",
+        "performance": "Performance depends on local hardware",
+        "requires": "Ollama installed and running locally"
+    },
+    "mixed_configs": "You can mix providers (e.g., Claude for lead, Ollama for subagents)",
+    "default_config": "Uses Claude 4 Sonnet for optimal performance/cost balance"
+}
+
 @app.get("/")
-async def root():
+async def root() -> HealthResponse:
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "service": "Multi-Agent Research System",
-        "version": "1.0.0"
-    }
+    return HealthResponse(
+        status="healthy",
+        service="Multi-Agent Research System",
+        version="1.0.0"
+    )
 
 @app.post("/research/start")
 async def start_research(
     query: ResearchQuery,
     background_tasks: BackgroundTasks
-) -> Dict[str, Any]:
+) -> ResearchStartResponse:
     """
     Start a new research task
     
@@ -51,31 +94,28 @@ async def start_research(
     Returns a research_id that can be used to check status and retrieve results.
     """
     
-    try:
-        # Validate query
-        if not query.query.strip():
-            raise HTTPException(status_code=400, detail="Query cannot be empty")
-            
-        # Start research asynchronously
-        async def run_research():
-            lead_agent = LeadResearchAgent()
-            result = await lead_agent.conduct_research(query)
-            return result
-            
-        # Create task
-        task = asyncio.create_task(run_research())
-        
-        # Generate research ID (in production, this would be handled differently)
-        research_id = UUID('12345678-1234-5678-1234-567812345678')  # Mock ID
-        
-        return {
-            "research_id": str(research_id),
-            "status": "started",
-            "message": "Research task initiated successfully"
-        }
+    # Blank queries are rejected by ResearchQuery validation; unexpected
+    # errors are handled by general_exception_handler
+    
+    # Start research asynchronously
+    async def run_research():
+        lead_agent = LeadResearchAgent(research_service.memory_store)
+        result = await lead_agent.conduct_research(query)
+        return result
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    # Create task
+    task = asyncio.create_task(run_research())
+    background_research_tasks.add(task)
+    task.add_done_callback(background_research_tasks.discard)
+    
+    # Generate research ID (in production, this would be handled differently)
+    research_id = UUID('12345678-1234-5678-1234-567812345678')  # Mock ID
+    
+    return ResearchStartResponse(
+        research_id=research_id,
+        status="started",
+        message="Research task initiated successfully"
+    )
 
 @app.get("/research/{research_id}/status")
 async def get_research_status(research_id: UUID) -> Dict[str, Any]:
@@ -92,12 +132,38 @@ async def get_research_status(research_id: UUID) -> Dict[str, Any]:
         
     return status
 
-@app.get("/research/{research_id}/result")
-async def get_research_result(research_id: UUID) -> ResearchResult:
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag
+    
+    Uses the weak comparison RFC 9110 requires for If-None-Match: the header
+    may list several tags, W/ prefixes are ignored, and "*" matches any.
+    """
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+@app.get("/research/{research_id}/result", response_model=ResearchResult)
+async def get_research_result(
+    research_id: UUID,
+    if_none_match: Optional[str] = Header(None)
+) -> Response:
     """
     Get the final result of a completed research task
     
-    Returns the full research report with citations and sources
+    Returns the full research report with citations and sources.
+    The result is already a validated model, so it is serialized once with
+    model_dump_json() instead of going through response_model validation.
+    Completed results never change, so clients polling with If-None-Match
+    get a 304 without a body.
     """
     
     result = await research_service.get_research_result(research_id)
@@ -108,7 +174,15 @@ async def get_research_result(research_id: UUID) -> ResearchResult:
             detail="Research result not found or not yet completed"
         )
         
-    return result
+    etag = f'"{result.research_id.hex}-{int(result.created_at.timestamp())}"'
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+        
+    return Response(
+        content=result.model_dump_json(),
+        media_type="application/json",
+        headers={"ETag": etag}
+    )
 
 @app.post("/research/demo")
 async def demo_research() -> Dict[str, Any]:
@@ -316,58 +390,26 @@ Industry analysts predict the AI agent market will reach $50 billion by 2027. Th
 async def get_available_tools() -> Dict[str, Any]:
     """Get list of available tools for agents"""
     
-    return {
-        "tools": [
-            {
-                "name": "web_search",
-                "description": "Search the web for information",
-                "parameters": ["query", "max_results"]
-            },
-            {
-                "name": "memory_store",
-                "description": "Store and retrieve context",
-                "parameters": ["key", "value"]
-            }
-        ]
-    }
+    return AVAILABLE_TOOLS
 
 @app.get("/models/info")
 async def get_model_info() -> Dict[str, Any]:
     """Get information about available models from all providers and current configuration"""
     
-    from app.core.model_providers import model_manager
-    
-    # Get provider status
-    provider_status = await model_manager.check_provider_status()
+    # Get provider status from the cached snapshot (re-checked when stale)
+    provider_status = await model_manager.get_provider_status()
     
     return {
         "status": "success",
         "model_info": settings.get_model_info(),
         "provider_status": provider_status,
-        "notes": {
-            "anthropic": {
-                "claude_4_series": "Latest models with enhanced reasoning and performance",
-                "claude_3_5_series": "Improved versions of Claude 3 with better capabilities", 
-                "claude_3_series": "Original Claude 3 models (legacy support)",
-                "requires": "ANTHROPIC_API_KEY environment variable"
-            },
-            "ollama": {
-                "local_models": "Run models locally without API costs",
-                "privacy": "Complete data privacy - no external API calls",
-                "performance": "Performance depends on local hardware",
-                "requires": "Ollama installed and running locally"
-            },
-            "mixed_configs": "You can mix providers (e.g., Claude for lead, Ollama for subagents)",
-            "default_config": "Uses Claude 4 Sonnet for optimal performance/cost balance"
-        }
+        "notes": MODEL_NOTES
     }
 
 @app.get("/ollama/status")
 async def get_ollama_status() -> Dict[str, Any]:
     """Check Ollama status and available models"""
     
-    from app.core.model_providers import model_manager, ModelProvider
-    
     try:
         # Check if Ollama is running
         ollama_provider = model_manager.providers[ModelProvider.OLLAMA]
@@ -415,13 +457,27 @@ async def general_exception_handler(request, exc):
         }
     )
 
+async def cleanup_memory_periodically():
+    """Drop expired contexts and results from the research service's store"""
+    
+    while True:
+        await asyncio.sleep(settings.MEMORY_CLEANUP_INTERVAL)
+        await research_service.memory_store.cleanup_expired()
+
 # Startup and shutdown events
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup"""
     print("Multi-Agent Research System starting up...")
+    app.state.memory_cleanup_task = asyncio.create_task(
+        cleanup_memory_periodically()
+    )
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
-    print("Multi-Agent Research System shutting down...")
\ No newline at end of file
+    print("Multi-Agent Research System shutting down...")
+    app.state.memory_cleanup_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await app.state.memory_cleanup_task
+    await close_http_client()
\ No newline at end of file
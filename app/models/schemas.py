@@ -1,6 +1,6 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional, Dict, Any, Literal
-from datetime import datetime
+from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
 class ResearchQuery(BaseModel):
@@ -9,10 +9,22 @@ class ResearchQuery(BaseModel):
     max_subagents: int = Field(default=3, ge=1, le=10)
     max_iterations: int = Field(default=5, ge=1, le=20)
     
+    @field_validator("query")
+    @classmethod
+    def query_not_empty(cls, value: str) -> str:
+        """Reject blank queries at parse time"""
+        if not value.strip():
+            raise ValueError("Query cannot be empty")
+        return value
     
+    
+def _new_internal_id() -> str:
+    """Generate an opaque id for objects that never leave the process"""
+    return uuid4().hex
+
 class SubAgentTask(BaseModel):
     """Task definition for a subagent"""
-    task_id: UUID = Field(default_factory=uuid4)
+    task_id: str = Field(default_factory=_new_internal_id)
     objective: str
     search_focus: str
     expected_output_format: str
@@ -29,7 +41,7 @@ class SearchResult(BaseModel):
 
 class SubAgentResult(BaseModel):
     """Result from a subagent's research"""
-    task_id: UUID
+    task_id: str
     findings: List[Dict[str, Any]]
     sources: List[SearchResult]
     summary: str
@@ -37,7 +49,7 @@ class SubAgentResult(BaseModel):
 
 class ResearchPlan(BaseModel):
     """Research plan created by lead agent"""
-    plan_id: UUID = Field(default_factory=uuid4)
+    plan_id: str = Field(default_factory=_new_internal_id)
     strategy: str
     subtasks: List[SubAgentTask]
     estimated_complexity: Literal["simple", "moderate", "complex"]
@@ -49,6 +61,18 @@ class CitationInfo(BaseModel):
     url: str
     times_cited: int
 
+class HealthResponse(BaseModel):
+    """Service health check response"""
+    status: str
+    service: str
+    version: str
+
+class ResearchStartResponse(BaseModel):
+    """Acknowledgement for a newly started research task"""
+    research_id: UUID
+    status: str
+    message: str
+
 class ResearchResult(BaseModel):
     """Final research result"""
     research_id: UUID
@@ -60,4 +84,4 @@ class ResearchResult(BaseModel):
     execution_time: float
     subagent_count: int
     report_sections: List[str]
-    created_at: datetime = Field(default_factory=datetime.utcnow)
\ No newline at end of file
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
\ No newline at end of file
@@ -18,7 +18,7 @@ class ResearchService:
         """Start a new research task"""
         
         # Create lead agent
-        lead_agent = LeadResearchAgent()
+        lead_agent = LeadResearchAgent(self.memory_store)
         
         # Start research task
         task = asyncio.create_task(
@@ -1,7 +1,8 @@
 import json
 import asyncio
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+import heapq
+import time
+from typing import Dict, Any, Optional, List, Tuple
 from uuid import UUID
 
 from app.models.schemas import ResearchResult
@@ -15,21 +16,30 @@ class MemoryStore:
     """
     
     def __init__(self):
-        self._store: Dict[str, Dict[str, Any]] = {}
-        self._ttl: Dict[str, datetime] = {}
+        self._store: Dict[str, Any] = {}
+        # Expiry times are time.monotonic() values, immune to wall-clock changes
+        self._ttl: Dict[str, float] = {}
+        # Min-heap of (expiry, key) so cleanup only visits expired entries
+        self._expiry_heap: List[Tuple[float, str]] = []
+        
+    def _set_ttl(self, key: str):
+        """Set the expiry for a key and index it for cleanup"""
+        expiry = time.monotonic() + settings.MEMORY_TTL
+        self._ttl[key] = expiry
+        heapq.heappush(self._expiry_heap, (expiry, key))
         
     async def save_context(self, research_id: UUID, context: Dict[str, Any]):
         """Save research context"""
-        key = f"context:{research_id}"
+        key = f"context:{research_id.hex}"
         self._store[key] = context
-        self._ttl[key] = datetime.utcnow() + timedelta(seconds=settings.MEMORY_TTL)
+        self._set_ttl(key)
         
     async def get_context(self, research_id: UUID) -> Optional[Dict[str, Any]]:
         """Retrieve research context"""
-        key = f"context:{research_id}"
+        key = f"context:{research_id.hex}"
         
         # Check if expired
-        if key in self._ttl and datetime.utcnow() > self._ttl[key]:
+        if key in self._ttl and time.monotonic() > self._ttl[key]:
             del self._store[key]
             del self._ttl[key]
             return None
@@ -37,33 +47,35 @@ class MemoryStore:
         return self._store.get(key)
         
     async def save_result(self, research_id: UUID, result: ResearchResult):
-        """Save final research result"""
-        key = f"result:{research_id}"
-        self._store[key] = result.dict()
-        self._ttl[key] = datetime.utcnow() + timedelta(seconds=settings.MEMORY_TTL)
+        """
+        Save final research result
+        
+        The validated instance is stored as-is; results are not mutated
+        after they are saved, so reads can return it without rebuilding.
+        """
+        key = f"result:{research_id.hex}"
+        self._store[key] = result
+        self._set_ttl(key)
         
     async def get_result(self, research_id: UUID) -> Optional[ResearchResult]:
         """Retrieve research result"""
-        key = f"result:{research_id}"
+        key = f"result:{research_id.hex}"
         
-        if key in self._ttl and datetime.utcnow() > self._ttl[key]:
+        if key in self._ttl and time.monotonic() > self._ttl[key]:
             del self._store[key]
             del self._ttl[key]
             return None
             
-        data = self._store.get(key)
-        if data:
-            return ResearchResult(**data)
-        return None
+        return self._store.get(key)
         
     async def cleanup_expired(self):
         """Remove expired entries"""
-        now = datetime.utcnow()
-        expired_keys = [
-            key for key, expiry in self._ttl.items()
-            if now > expiry
-        ]
+        now = time.monotonic()
         
-        for key in expired_keys:
-            del self._store[key]
-            del self._ttl[key]
\ No newline at end of file
+        while self._expiry_heap and now > self._expiry_heap[0][0]:
+            expiry, key = heapq.heappop(self._expiry_heap)
+            
+            # Skip stale entries for keys that were re-saved or already removed
+            if self._ttl.get(key) == expiry:
+                del self._store[key]
+                del self._ttl[key]
\ No newline at end of file
@@ -1,17 +1,50 @@
 import asyncio
+import time
+from collections import OrderedDict
 import httpx
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from bs4 import BeautifulSoup
 import json
 
 from app.models.schemas import SearchResult
 from app.core.config import settings
 
+# Pooled HTTP client shared by all tool instances so connections are reused
+# across subagents instead of each one opening its own
+_http_client: Optional[httpx.AsyncClient] = None
+
+# Search results shared by all tool instances (each subagent creates its own
+# tool), keyed by normalized query and holding (expiry, results). Kept in
+# least-recently-used order so eviction pops from the front.
+_search_cache: "OrderedDict[str, Tuple[float, List[SearchResult]]]" = OrderedDict()
+
+
+def _normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace so trivially different queries share a cache entry"""
+    return " ".join(query.lower().split())
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(timeout=settings.SEARCH_TIMEOUT)
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared HTTP client (called on application shutdown)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 class WebSearchTool:
     """Tool for performing web searches"""
     
     def __init__(self):
-        self.client = httpx.AsyncClient(timeout=settings.SEARCH_TIMEOUT)
+        self.client = get_http_client()
         
     async def search(self, query: str) -> List[SearchResult]:
         """
@@ -21,8 +54,17 @@ class WebSearchTool:
         1. Use a real search API (Google, Bing, etc.)
         2. Implement proper rate limiting
         3. Handle API errors gracefully
+        
+        Non-empty results are cached for SEARCH_CACHE_TTL seconds. Callers
+        receive copies because agents update relevance scores in place.
         """
         
+        cache_key = _normalize_query(query)
+        cached = _search_cache.get(cache_key)
+        if cached and time.monotonic() < cached[0]:
+            _search_cache.move_to_end(cache_key)
+            return [result.model_copy() for result in cached[1]]
+        
         # Mock search results for demonstration
         # In production, replace with actual API calls
         mock_results = await self._mock_search(query)
@@ -37,6 +79,19 @@ class WebSearchTool:
             if isinstance(r, SearchResult)
         ]
         
+        # Only cache successful searches; if every fetch failed, the next
+        # call should retry instead of serving an empty result for the TTL
+        if valid_results:
+            _search_cache[cache_key] = (
+                time.monotonic() + settings.SEARCH_CACHE_TTL,
+                [result.model_copy() for result in valid_results]
+            )
+            _search_cache.move_to_end(cache_key)
+            
+            # Evict the least recently used entry once the cache is full
+            if len(_search_cache) > settings.SEARCH_CACHE_MAX_SIZE:
+                _search_cache.popitem(last=False)
+        
         return valid_results
         
     async def _mock_search(self, query: str) -> List[Dict[str, Any]]:
@@ -122,5 +177,10 @@ class WebSearchTool:
             raise
             
     async def close(self):
-        """Clean up resources"""
-        await self.client.aclose()
\ No newline at end of file
+        """
+        Clean up resources
+        
+        The HTTP client is shared between tools and is closed once at
+        shutdown by close_http_client(), so there is nothing to release here.
+        """
+        self.client = None
\ No newline at end of file